@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import struct
 from dataclasses import InitVar
-from typing import Any, ClassVar, Literal, NamedTuple, TypeVar
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Literal, NamedTuple, TypeVar
 
 from typing_extensions import Annotated, get_args, get_origin, get_type_hints
 
@@ -19,8 +20,11 @@ FLOAT_CONVERSION = {2: "e", 4: "f", 8: "d"}
 SIGNED_SPECIFIERS = ("signed", "unsigned")
 INTERNAL_NAMES = (
     "__bytestruct_fields__",
+    "__bytestruct_values__",
+    "__bytestruct_checked_fields__",
     "__bytestruct_format__",
     "__bytestruct_size__",
+    "__bytestruct_struct__",
     "__bytestruct_cached__",
 )
 
@@ -44,21 +48,47 @@ class _FieldDescriptor(NamedTuple):
     is_bytestruct: bool = False
 
 
+def _values_getter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """Return a callable fetching the attributes `names` of an object as a tuple.
+
+    Unlike `operator.attrgetter()`, which is used if possible, the callable also
+    returns a tuple for less than two names.
+    """
+    if len(names) > 1:
+        return attrgetter(*names)
+    if names:
+        getter = attrgetter(*names)
+        return lambda obj: (getter(obj),)
+    return lambda obj: ()
+
+
 class _ByteStructMeta(type):
     """Metaclass of `ByteStruct`.
 
     Analyzes the type annotations found in a `ByteStruct` subclass and sets
-    `__bytestruct_fields__`, `__bytestruct_format__` and `__bytestruct_size__`
-    accordingly.
+    `__bytestruct_fields__`, `__bytestruct_values__`,
+    `__bytestruct_checked_fields__`, `__bytestruct_format__`, `__bytestruct_size__`
+    and `__bytestruct_struct__` accordingly.
 
     - `__bytestruct_fields__` is a mapping of field names (`str`) to field
         descriptors (`_FieldDescriptor`). A field descriptor contains metadata about
         a field of the `ByteStruct`. See `_FieldDescriptor` for more information.
+    - `__bytestruct_values__` is a static method returning a tuple of the values
+        of all fields of an instance except pad bytes, in the order of
+        `__bytestruct_fields__`. These are exactly the values passed to
+        `struct.pack()`, except for embedded `ByteStruct` instances.
+    - `__bytestruct_checked_fields__` is a tuple of (index, name, descriptor)
+        triples of the fields within `__bytestruct_values__` which `struct.pack()`
+        cannot validate or convert by itself, i.e. fields of type `bytes` and
+        embedded `ByteStruct` fields.
     - `__bytestruct_format__` is the format string which is passed to
         `struct.pack()` and `struct.unpack()` to convert between the values of the
         `ByteStruct` and its `bytes` form as read from or written to a disk.
     - `__bytestruct_size__` is the size of the `bytes` form of the `ByteStruct`
         in bytes.
+    - `__bytestruct_struct__` is a `struct.Struct` object compiled from
+        `__bytestruct_format__`, so that the format string is not parsed again on
+        every call of `pack()` and `unpack()`.
     """
 
     def __new__(
@@ -156,9 +186,23 @@ class _ByteStructMeta(type):
 
             fields[name] = _FieldDescriptor(annotated_type, args[1:])
 
+        value_fields = [
+            (name, descriptor)
+            for name, descriptor in fields.items()
+            if descriptor.type_origin is not NoneType
+        ]
         cls.__bytestruct_fields__ = fields
+        cls.__bytestruct_values__ = staticmethod(
+            _values_getter(tuple(name for name, _ in value_fields))
+        )
+        cls.__bytestruct_checked_fields__ = tuple(
+            (index, name, descriptor)
+            for index, (name, descriptor) in enumerate(value_fields)
+            if descriptor.is_bytestruct or descriptor.type_origin is bytes
+        )
         cls.__bytestruct_format__ = format_
-        cls.__bytestruct_size__ = struct.calcsize(format_)
+        cls.__bytestruct_struct__ = struct.Struct(format_)
+        cls.__bytestruct_size__ = cls.__bytestruct_struct__.size
 
     def __len__(cls) -> int:
         """Size of the `bytes` form of the `ByteStruct` in bytes."""
@@ -212,8 +256,11 @@ class ByteStruct(metaclass=_ByteStructMeta):
 
     # Populated per class
     __bytestruct_fields__: "dict[str, _FieldDescriptor]"  # noqa: UP037
+    __bytestruct_values__: "Callable[[ByteStruct], tuple[Any, ...]]"  # noqa: UP037
+    __bytestruct_checked_fields__: "tuple[tuple[int, str, _FieldDescriptor], ...]"  # noqa: UP037
     __bytestruct_format__: str
     __bytestruct_size__: int
+    __bytestruct_struct__: struct.Struct
 
     # Populated per instance
     __bytestruct_cached__: bytes
@@ -257,37 +304,33 @@ class ByteStruct(metaclass=_ByteStructMeta):
         Because this involves creating a `bytes` version of the `ByteStruct`
         instance anyway, we cache the resulting `bytes` object.
         """
-        values = []
-
-        for name, descriptor in self.__bytestruct_fields__.items():
-            type_ = descriptor.type_origin
-
-            # struct.pack() does not expect a value for pad bytes, so skip
-            if type_ is NoneType:
-                continue
-
-            value = getattr(self, name)
-
-            # The embedded ByteStruct was validated the same way, so we can simply
-            # request its cached bytes version without a huge performance impact.
-            if descriptor.is_bytestruct:
-                values.append(bytes(value))
-                continue
-
-            # Annotated type
-            if type_ is bytes:
+        # struct.pack() does not expect a value for pad bytes, so they are skipped
+        values = self.__bytestruct_values__(self)
+
+        if self.__bytestruct_checked_fields__:
+            values_list = list(values)
+            for index, name, descriptor in self.__bytestruct_checked_fields__:
+                value = values_list[index]
+
+                # The embedded ByteStruct was validated the same way, so we can
+                # simply request its cached bytes version without a huge performance
+                # impact.
+                if descriptor.is_bytestruct:
+                    values_list[index] = bytes(value)
+                    continue
+
+                # Annotated type bytes
                 size = descriptor.type_args[0]
                 if len(value) != size:
                     raise ValidationError(
                         f"Value of field {name!r} must be of length {size} bytes, "
                         f"got {len(value)} bytes"
                     )
-
-            values.append(value)
+            values = tuple(values_list)
 
         # All other values (int and float) are validated via struct.pack().
         try:
-            bytes_ = struct.pack(self.__bytestruct_format__, *values)
+            bytes_ = self.__bytestruct_struct__.pack(*values)
         except (struct.error, OverflowError) as e:
             raise ValidationError(
                 f"Value out of range (format is {self.__bytestruct_format__!r})"
@@ -315,29 +358,30 @@ class ByteStruct(metaclass=_ByteStructMeta):
         if len(b) != size:
             raise ValueError(f"Structure is {size} bytes long, got {len(b)} bytes")
 
-        unpacked_values = struct.unpack(cls.__bytestruct_format__, b)
+        unpacked_values = iter(cls.__bytestruct_struct__.unpack(b))
         values: list[Any] = []
-        padding_count = 0
 
         # Create list of values for dataclass
         # This includes embedded ByteStructs and None values for padding.
-        for index, descriptor in enumerate(fields.values()):
+        for descriptor in fields.values():
             type_ = descriptor.type_origin
             if type_ is NoneType:
                 values.append(None)
-                padding_count += 1
                 continue
 
-            value = unpacked_values[index - padding_count]
+            value = next(unpacked_values)
             if descriptor.is_bytestruct:
                 value = type_.from_bytes(value)
             values.append(value)
 
-        self = cls(*values)
-
         # Keep packed version of ByteStruct in memory
+        # Set it before initialization so that __post_init__() does not pack the
+        # values we just unpacked again. struct.unpack() already guarantees that
+        # they fit their formats, so only the custom validation logic is run.
         # Avoid __setattr__() here because this is a frozen dataclass.
+        self = cls.__new__(cls)
         self.__dict__["__bytestruct_cached__"] = b
+        self.__init__(*values)  # type: ignore[misc]
         return self
 
     def __bytes__(self) -> bytes:
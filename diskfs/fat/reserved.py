@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import warnings
 from dataclasses import dataclass
+from functools import cached_property
 
 # noinspection PyUnresolvedReferences, PyProtectedMember
 from typing import TYPE_CHECKING, ClassVar, Protocol, _ProtocolMeta
@@ -480,7 +481,7 @@ class EbpbFat32(ByteStruct):
     def bpb_dos_200(self) -> BpbDos200:
         return self.short.bpb_dos_331.bpb_dos_200
 
-    @property
+    @cached_property
     def total_size(self) -> int | None:
         total_size_short = self.short.total_size
         if total_size_short is None:
@@ -698,12 +699,12 @@ class BootSector:
         """Size of a cluster in sectors."""
         return self.bpb.bpb_dos_200.cluster_size
 
-    @property
+    @cached_property
     def total_clusters(self) -> int:
         """Total clusters provided by the file system."""
         return self.data_region_size // self.cluster_size
 
-    @property
+    @cached_property
     def fat_type(self) -> FatType:
         """Type of FAT file system (FAT12, FAT16 or FAT32) according to the amount of
         clusters provided by the file system.
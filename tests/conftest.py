@@ -6,11 +6,12 @@ import os
 import subprocess
 import sys
 import warnings
+from contextlib import contextmanager
 from pathlib import Path
 from shutil import copyfileobj, rmtree
 from subprocess import CalledProcessError
 from tempfile import mkdtemp, mkstemp
-from typing import Sequence
+from typing import Iterator, Sequence
 
 import pytest
 
@@ -26,17 +27,29 @@ def tempdir():
     rmtree(path)  # clean up
 
 
-@pytest.fixture
-def tempfile():
-    """Fixture providing a new temporary file for testing purposes.
+@contextmanager
+def _temporary_file() -> Iterator[Path]:
+    """Context manager creating a new empty temporary file and removing it on exit.
 
     Returns a `pathlib.Path` object representing the path of the temporary file.
     """
     fd, path_str = mkstemp()
     os.close(fd)  # we are going to use a Path object instead
     path = Path(path_str)
-    yield path
-    path.unlink(missing_ok=True)  # clean up
+    try:
+        yield path
+    finally:
+        path.unlink(missing_ok=True)  # clean up
+
+
+@pytest.fixture
+def tempfile():
+    """Fixture providing a new temporary file for testing purposes.
+
+    Returns a `pathlib.Path` object representing the path of the temporary file.
+    """
+    with _temporary_file() as path:
+        yield path
 
 
 class CalledProcessWarning(UserWarning):
@@ -62,90 +75,90 @@ if sys.platform == "win32":
 
     from . import data
 
-    @pytest.fixture
-    def block_device(request, tempfile):
+    @pytest.fixture(scope="session")
+    def block_device(request):
         size, (lss, pss) = request.param
         gzipped_filename = f"empty_{size}_{lss}_{pss}.vhdx.gz"
-
-        # Decompress VHDX file
-        with importlib.resources.path(data, gzipped_filename) as gzipped_path:
-            with gzip.open(gzipped_path, "rb") as f_in:
-                with tempfile.open("wb") as f_out:
-                    copyfileobj(f_in, f_out)
-
-        # Mount virtual hard disk
-        backfile_path = tempfile.absolute()
-        mount_command = (
-            f'(Mount-DiskImage "{backfile_path}" -NoDriveLetter -StorageType VHDX)'
-            f".DevicePath"
-        )
-        completed_process = subprocess.run(
-            ["powershell.exe", "-Command", mount_command],
-            capture_output=True,
-            check=True,
-            encoding="utf-8",
-        )
-        device_path = completed_process.stdout.rstrip()
-        yield device_path
-
-        # Clean up
-        dismount_command = f'Dismount-DiskImage -DevicePath "{device_path}"'
-        _run_dismount(["powershell.exe", "-Command", dismount_command])
+        with _temporary_file() as backfile:
+            # Decompress VHDX file
+            with importlib.resources.path(data, gzipped_filename) as gzipped_path:
+                with gzip.open(gzipped_path, "rb") as f_in:
+                    with backfile.open("wb") as f_out:
+                        copyfileobj(f_in, f_out)
+
+            # Mount virtual hard disk
+            backfile_path = backfile.absolute()
+            mount_command = (
+                f'(Mount-DiskImage "{backfile_path}" -NoDriveLetter -StorageType VHDX)'
+                f".DevicePath"
+            )
+            completed_process = subprocess.run(
+                ["powershell.exe", "-Command", mount_command],
+                capture_output=True,
+                check=True,
+                encoding="utf-8",
+            )
+            device_path = completed_process.stdout.rstrip()
+            yield device_path
+
+            # Clean up
+            dismount_command = f'Dismount-DiskImage -DevicePath "{device_path}"'
+            _run_dismount(["powershell.exe", "-Command", dismount_command])
 
 elif sys.platform == "linux":
 
-    @pytest.fixture
-    def block_device(request, tempfile):
+    @pytest.fixture(scope="session")
+    def block_device(request):
         size, (lss, pss) = request.param
-
-        # Expand new temporary file to desired size
-        with tempfile.open("wb") as f:
-            f.truncate(size)
-
-        # Create loop device
-        backfile_path = tempfile.absolute()
-        completed_process = subprocess.run(
-            ["losetup", "-fLP", "-b", str(lss), "--show", backfile_path],
-            capture_output=True,
-            check=True,
-            encoding="utf-8",
-        )
-        device_path = completed_process.stdout.rstrip()
-        yield device_path
-
-        # Clean up
-        _run_dismount(["losetup", "-d", device_path])
+        with _temporary_file() as backfile:
+            # Expand new temporary file to desired size
+            with backfile.open("wb") as f:
+                f.truncate(size)
+
+            # Create loop device
+            backfile_path = backfile.absolute()
+            completed_process = subprocess.run(
+                ["losetup", "-fLP", "-b", str(lss), "--show", backfile_path],
+                capture_output=True,
+                check=True,
+                encoding="utf-8",
+            )
+            device_path = completed_process.stdout.rstrip()
+            yield device_path
+
+            # Clean up
+            _run_dismount(["losetup", "-d", device_path])
 
 elif sys.platform == "darwin":
 
-    @pytest.fixture
-    def block_device(request, tempfile):
+    @pytest.fixture(scope="session")
+    def block_device(request):
         size, _ = request.param
-
-        # Expand new temporary file to desired size
-        with tempfile.open("wb") as f:
-            f.truncate(size)
-
-        # Attach disk image
-        backfile_path = tempfile.absolute()
-        completed_process = subprocess.run(
-            [
-                "hdiutil",
-                "attach",
-                "-imagekey",
-                "diskimage-class=CRawDiskImage",
-                "-nomount",
-                backfile_path,
-            ],
-            capture_output=True,
-            check=True,
-            encoding="utf-8",
-        )
-        device_path = completed_process.stdout.split()[0]  # see man hdiutil
-        yield device_path
-
-        # Clean up
-        _run_dismount(["hdiutil", "detach", device_path])
+        with _temporary_file() as backfile:
+            # Expand new temporary file to desired size
+            with backfile.open("wb") as f:
+                f.truncate(size)
+
+            # Attach disk image
+            backfile_path = backfile.absolute()
+            completed_process = subprocess.run(
+                [
+                    "hdiutil",
+                    "attach",
+                    "-imagekey",
+                    "diskimage-class=CRawDiskImage",
+                    "-nomount",
+                    backfile_path,
+                ],
+                capture_output=True,
+                check=True,
+                encoding="utf-8",
+            )
+            device_path = completed_process.stdout.split()[0]  # see man hdiutil
+            yield device_path
+
+            # Clean up
+            _run_dismount(["hdiutil", "detach", device_path])
 
 else:
     raise RuntimeError(f"Unspported platform {sys.platform!r}")
@@ -158,5 +171,8 @@ sector size pair for the block device). Some platforms do not support setting th
 logical or physical sector size for a virtual block device. In that case,
 values which cannot be used are ignored.
 
+A block device is shared by all tests of a session using the same parameters, so
+tests must not modify it.
+
 Returns a string representing the path of the block device.
 """
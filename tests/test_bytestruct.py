@@ -259,8 +259,14 @@ class TestByteStructMeta:
         """
         bs = bytestruct_multi(byteorder)
         assert len(bs.__bytestruct_fields__) == 8
+        checked_fields = [
+            (index, name) for index, name, _ in bs.__bytestruct_checked_fields__
+        ]
+        assert checked_fields == [(1, "f_3"), (3, "f_6"), (4, "f_7")]
         assert bs.__bytestruct_format__ == bs.expected_format
         assert bs.__bytestruct_size__ == len(ArbitraryByteStruct) + 28
+        assert bs.__bytestruct_struct__.format == bs.__bytestruct_format__
+        assert bs.__bytestruct_struct__.size == bs.__bytestruct_size__
 
     def test_analysis_success_empty(self):
         """Test the result of the analysis of a `ByteStruct` without any fields."""
@@ -306,6 +312,30 @@ class TestByteStructMeta:
         B(b"xyz", "test", 5)
 
 
+# Parameter sets of `TestByteStruct.test_single_int()`, covering the bounds of each
+# integer size
+SINGLE_INT_PARAMS = tuple(
+    chain.from_iterable(
+        (
+            (byteorder, size, False, -1, False),
+            (byteorder, size, False, 0, True),
+            (byteorder, size, False, 1 << (size * 8 - 1), True),
+            (byteorder, size, False, (1 << size * 8) - 1, True),
+            (byteorder, size, False, (1 << size * 8), False),
+            (byteorder, size, True, -(1 << size * 8 - 1) - 1, False),
+            (byteorder, size, True, -(1 << size * 8 - 1), True),
+            (byteorder, size, True, -1, True),
+            (byteorder, size, True, 0, True),
+            (byteorder, size, True, 1, True),
+            (byteorder, size, True, (1 << size * 8 - 1) - 1, True),
+            (byteorder, size, True, (1 << size * 8 - 1), False),
+        )
+        for byteorder in ["<", ">", "!", "="]
+        for size in [1, 2, 4, 8]
+    )
+)
+
+
 class TestByteStruct:
     """Tests for `ByteStruct`."""
 
@@ -366,24 +396,7 @@ class TestByteStruct:
 
     @pytest.mark.parametrize(
         ["byteorder", "size", "signed", "value", "accept"],
-        chain.from_iterable(
-            (
-                (byteorder, size, False, -1, False),
-                (byteorder, size, False, 0, True),
-                (byteorder, size, False, 1 << (size * 8 - 1), True),
-                (byteorder, size, False, (1 << size * 8) - 1, True),
-                (byteorder, size, False, (1 << size * 8), False),
-                (byteorder, size, True, -(1 << size * 8 - 1) - 1, False),
-                (byteorder, size, True, -(1 << size * 8 - 1), True),
-                (byteorder, size, True, -1, True),
-                (byteorder, size, True, 0, True),
-                (byteorder, size, True, 1, True),
-                (byteorder, size, True, (1 << size * 8 - 1) - 1, True),
-                (byteorder, size, True, (1 << size * 8 - 1), False),
-            )
-            for byteorder in ["<", ">", "!", "="]
-            for size in [1, 2, 4, 8]
-        ),
+        SINGLE_INT_PARAMS,
     )
     def test_single_int(self, byteorder, size, signed, value, accept):
         """Test validation and conversion on a `ByteStruct` subclass with a single
@@ -592,10 +605,14 @@ class TestByteStruct:
     )
     def test_custom_validation(self, value_1, value_2, accept):
         """Test that custom validation logic is automatically triggered when
-        instantiating a `ByteStruct`.
+        instantiating a `ByteStruct`, including via `from_bytes()`.
         """
+        b = value_1.to_bytes(4, "little") + value_2
         if accept:
             CustomValidationByteStruct(value_1, value_2)
+            CustomValidationByteStruct.from_bytes(b)
         else:
             with pytest.raises(Exception):
                 CustomValidationByteStruct(value_1, value_2)
+            with pytest.raises(Exception):
+                CustomValidationByteStruct.from_bytes(b)
@@ -70,7 +70,12 @@ def test_device_properties(block_device) -> None:
 @pytest.mark.parametrize(
     ["block_device", "size_expected", "sector_size_expected"],
     [
-        ((size, sector_size), size, sector_size)  # pass to fixture and to test function
+        pytest.param(
+            (size, sector_size),  # pass to fixture and to test function
+            size,
+            sector_size,
+            id=f"{size}-{sector_size.logical}-{sector_size.physical}",
+        )
         for size in SIZES
         for sector_size in SECTOR_SIZES
     ],
@@ -29,4 +29,4 @@ def test_device_io_control_fail(tempfile):
     """
     with tempfile.open("rb") as f, pytest.raises(OSError) as exc_info:
         device_io_control(f.fileno(), IOCTL_STORAGE_QUERY_PROPERTY)
-        assert exc_info.value.winerror is not None
+    assert exc_info.value.winerror is not None